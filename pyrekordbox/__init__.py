@@ -5,7 +5,7 @@
 from .anlz import AnlzFile, get_anlz_paths, read_anlz_files, walk_anlz_paths
 from .config import get_config, show_config, update_config
 from .db6 import Rekordbox6Database, open_rekordbox_database
-from .logger import logger
+from .logger import configure_logging, logger
 from .mysettings import (
     DevSettingFile,
     DjmMySettingFile,
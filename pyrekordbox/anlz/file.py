@@ -7,7 +7,7 @@ from collections import abc
 from pathlib import Path
 from typing import Union
 
-from construct import Int16ub
+import numpy as np
 
 from . import structs
 from .tags import TAGS
@@ -103,8 +103,10 @@ class AnlzFile(abc.Mapping):
         tags = list()
         i = file_header.len_header
         while i < file_header.len_file:
-            # Get data starting from struct
-            tag_data = data[i:]
+            # Get the data of the tag. The tag length is stored after the four byte
+            # type and the header length, so only the tag bytes have to be copied
+            len_tag = int.from_bytes(data[i + 8 : i + 12], "big")
+            tag_data = data[i : i + len_tag]
             # Get the four byte struct type
             tag_type = tag_data[:4].decode("ascii")
 
@@ -117,21 +119,18 @@ class AnlzFile(abc.Mapping):
                 # For this we check the validity of mood and bank
                 # Mood: High=1, Mid=2, Low=3
                 # Bank: 0-8
-                mood = Int16ub.parse(tag_data[18:20])
-                bank = Int16ub.parse(tag_data[28:30])
+                mood = int.from_bytes(tag_data[18:20], "big")
+                bank = int.from_bytes(tag_data[28:30], "big")
                 if 1 <= mood <= 3 and 0 <= bank <= 8:
                     logger.debug("PSSI is not garbled!")
                 else:
                     logger.debug("PSSI is garbled!")
                     # deobfuscate tag_data[18:] using xor with XOR_MASK+len_entries
-                    len_entries = Int16ub.parse(tag_data[16:])
-                    tag_data = bytearray(data[i : i + len(tag_data)])
-                    for x in range(len(tag_data[18:])):
-                        mask = XOR_MASK[x % len(XOR_MASK)] + len_entries
-                        if mask > 255:
-                            mask -= 256
-                        tag_data[x + 18] ^= mask
-                    tag_data = bytes(tag_data)
+                    len_entries = int.from_bytes(tag_data[16:18], "big")
+                    mask = bytes((b + len_entries) & 0xFF for b in XOR_MASK)
+                    body = np.frombuffer(tag_data, dtype=np.uint8, offset=18)
+                    mask = np.resize(np.frombuffer(mask, dtype=np.uint8), len(body))
+                    tag_data = tag_data[:18] + (body ^ mask).tobytes()
 
             try:
                 # Parse the struct
@@ -3,14 +3,23 @@
 # Date:   2023-08-13
 
 import datetime
+import functools
 import logging
 import secrets
+import sqlite3
 from pathlib import Path
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import MetaData, create_engine, event, or_, select
-from sqlalchemy.exc import NoResultFound
+from sqlalchemy import (
+    MetaData,
+    bindparam,
+    create_engine,
+    event,
+    func,
+    or_,
+    select,
+)
 from sqlalchemy.orm import Query, Session
 from sqlalchemy.sql.sqltypes import DateTime, String
 
@@ -23,24 +32,54 @@ from .registry import RekordboxAgentRegistry
 from .smartlist import SmartList
 from .tables import DjmdContent, FileType, PlaylistType
 
-try:
-    from sqlcipher3 import dbapi2 as sqlite3  # noqa
+MAX_VERSION = "6.6.5"
 
-    _sqlcipher_available = True
-except ImportError:
-    import sqlite3
+# Connection-level SQLite settings applied to every new connection of the engine.
+# The journal mode is deliberately left untouched: it is persisted in the database
+# file, which is shared with Rekordbox.
+SQLITE_PRAGMAS = (
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA temp_store=MEMORY",
+)
 
-    _sqlcipher_available = False
+logger = logging.getLogger(__name__)
 
-MAX_VERSION = "6.6.5"
+# Engines of the opened databases, shared by all open handlers of the same file,
+# and the number of open handlers using each engine. An engine is disposed and
+# dropped when the last handler using it is closed.
+_ENGINES = dict()
+_ENGINE_USERS = dict()
 
-logger = logging.getLogger(__name__)
+# Statement used for checking if a track with a given path already exists
+_CONTENT_BY_PATH = (
+    select(DjmdContent.ID).where(DjmdContent.FolderPath == bindparam("path")).limit(1)
+)
 
 
 class NoCachedKey(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=None)
+def _load_sqlcipher():
+    """Returns the ``sqlcipher3`` DB-API module or None if it is not installed.
+
+    The import is deferred until an encrypted database is opened, so working with
+    unencrypted databases doesn't load the extension.
+    """
+    try:
+        from sqlcipher3 import dbapi2  # noqa
+    except ImportError:
+        return None
+    return dbapi2
+
+
+def __getattr__(name):
+    if name == "_sqlcipher_available":
+        return _load_sqlcipher() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def open_rekordbox_database(path=None, key="", unlock=True, sql_driver=None):
     """Opens a connection to the Rekordbox v6 master.db SQLite3 database.
 
@@ -103,9 +142,10 @@ def open_rekordbox_database(path=None, key="", unlock=True, sql_driver=None):
 
     # Open database
     if sql_driver is None:
-        # Use default sqlite3 package
-        # This requires that the 'sqlite3.dll' was replaced by the 'sqlcipher.dll'
-        sql_driver = sqlite3
+        # Use the sqlcipher3 package if available, otherwise the default sqlite3
+        # package. The latter requires that the 'sqlite3.dll' was replaced by the
+        # 'sqlcipher.dll' for unlocking the database.
+        sql_driver = (_load_sqlcipher() if unlock else None) or sqlite3
     con = sql_driver.connect(str(path))
 
     if unlock:
@@ -127,22 +167,87 @@ def open_rekordbox_database(path=None, key="", unlock=True, sql_driver=None):
     # Check connection
     try:
         con.execute("SELECT name FROM sqlite_master WHERE type='table';")
-    except sqlite3.DatabaseError as e:
+    except sql_driver.DatabaseError as e:
         msg = f"Opening database failed: '{e}'. Check if the database key is correct!"
-        raise sqlite3.DatabaseError(msg)
+        raise sql_driver.DatabaseError(msg)
     else:
         logger.info("Database unlocked!")
 
     return con
 
 
-def _parse_query_result(query, kwargs):
-    if "ID" in kwargs or "registry_id" in kwargs:
-        try:
-            query = query.one()
-        except NoResultFound:
-            return None
-    return query
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _get_engine(path, key="", unlock=True):
+    """Returns the SQLAlchemy engine of a database file.
+
+    Engines are cached, so opening the same database multiple times reuses the
+    existing engine and its connection pool. The device, inode and modification
+    time of the file are part of the cache key, so a file that was replaced or
+    modified in the meantime never reuses a stale engine. Each call has to be
+    paired with a call of :func:`_release_engine`.
+    """
+    stat = path.stat()
+    cache_key = (
+        str(path.resolve()),
+        stat.st_dev,
+        stat.st_ino,
+        stat.st_mtime_ns,
+        key,
+        unlock,
+    )
+    engine = _ENGINES.get(cache_key)
+    if engine is None:
+        if unlock:
+            url = f"sqlite+pysqlcipher://:{key}@/{path}?"
+            engine = create_engine(url, module=_load_sqlcipher())
+        else:
+            engine = create_engine(f"sqlite:///{path}")
+        # The key of encrypted databases is set by the dialect before this runs
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        _ENGINES[cache_key] = engine
+    _ENGINE_USERS[engine] = _ENGINE_USERS.get(engine, 0) + 1
+    return engine
+
+
+def _release_engine(engine):
+    """Releases an engine returned by :func:`_get_engine`.
+
+    Once no handler uses the engine anymore, it is removed from the cache and its
+    pooled connections are closed.
+    """
+    users = _ENGINE_USERS.pop(engine, 1) - 1
+    if users > 0:
+        _ENGINE_USERS[engine] = users
+        return
+    for cache_key, cached in list(_ENGINES.items()):
+        if cached is engine:
+            del _ENGINES[cache_key]
+    engine.dispose()
+
+
+def _table_getter(name, table):
+    """Creates a ``get_*`` method returning a filtered query for the given table.
+
+    The ``name`` is the attribute name of the method in the database handler class.
+    """
+
+    def getter(self, **kwargs):
+        query = self.query(table).filter_by(**kwargs)
+        if "ID" in kwargs or "registry_id" in kwargs:
+            # Filtering by the primary key: return the unique instance or None
+            return query.one_or_none()
+        return query
+
+    getter.__doc__ = f"Creates a filtered query for the ``{table.__name__}`` table."
+    getter.__name__ = name
+    getter.__qualname__ = f"Rekordbox6Database.{name}"
+    return getter
 
 
 class Rekordbox6Database:
@@ -212,7 +317,7 @@ class Rekordbox6Database:
             raise FileNotFoundError(f"File '{path}' does not exist!")
         # Open database
         if unlock:
-            if not _sqlcipher_available:
+            if _load_sqlcipher() is None:
                 raise ImportError(
                     "Could not unlock database: 'sqlcipher3' package not found"
                 )
@@ -233,19 +338,15 @@ class Rekordbox6Database:
                     raise ValueError("The provided database key doesn't look valid!")
 
             logger.info("Key: %s", key)
-            # Unlock database and create engine
-            url = f"sqlite+pysqlcipher://:{key}@/{path}?"
-            engine = create_engine(url, module=sqlite3)
-        else:
-            engine = create_engine(f"sqlite:///{path}")
-
         if not db_dir:
             db_dir = path.parent
         db_dir = Path(db_dir)
         if not db_dir.exists():
             raise FileNotFoundError(f"Database directory '{db_dir}' does not exist!")
 
-        self.engine = engine
+        # The engine is created (or taken from the cache) when the session is opened
+        self._engine_args = (path, key, unlock)
+        self.engine = None
         self.session: Optional[Session] = None
 
         self.registry = RekordboxAgentRegistry(self)
@@ -286,16 +387,23 @@ class Rekordbox6Database:
         >>> db.open()
         """
         if self.session is None:
+            self.engine = _get_engine(*self._engine_args)
             self.session = Session(bind=self.engine)
             self.registry.clear_buffer()
 
     def close(self):
-        """Close the currently active session."""
+        """Close the currently active session.
+
+        The pooled connections of the engine are closed as well once no other open
+        handler uses the engine, so no file handle of the database is kept open after
+        closing all handlers.
+        """
         for key in self._events:
             self.unregister_event(key)
         self.registry.clear_buffer()
         self.session.close()
         self.session = None
+        _release_engine(self.engine)
 
     def __enter__(self):
         return self
@@ -516,35 +624,12 @@ class Rekordbox6Database:
 
     # -- Table queries -----------------------------------------------------------------
 
-    def get_active_censor(self, **kwargs):
-        """Creates a filtered query for the ``DjmdActiveCensor`` table."""
-        query = self.query(tables.DjmdActiveCensor).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_album(self, **kwargs):
-        """Creates a filtered query for the ``DjmdAlbum`` table."""
-        query = self.query(tables.DjmdAlbum).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_artist(self, **kwargs):
-        """Creates a filtered query for the ``DjmdArtist`` table."""
-        query = self.query(tables.DjmdArtist).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_category(self, **kwargs):
-        """Creates a filtered query for the ``DjmdCategory`` table."""
-        query = self.query(tables.DjmdCategory).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_color(self, **kwargs):
-        """Creates a filtered query for the ``DjmdColor`` table."""
-        query = self.query(tables.DjmdColor).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_content(self, **kwargs):
-        """Creates a filtered query for the ``DjmdContent`` table."""
-        query = self.query(tables.DjmdContent).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
+    get_active_censor = _table_getter("get_active_censor", tables.DjmdActiveCensor)
+    get_album = _table_getter("get_album", tables.DjmdAlbum)
+    get_artist = _table_getter("get_artist", tables.DjmdArtist)
+    get_category = _table_getter("get_category", tables.DjmdCategory)
+    get_color = _table_getter("get_color", tables.DjmdColor)
+    get_content = _table_getter("get_content", tables.DjmdContent)
 
     # noinspection PyUnresolvedReferences
     def search_content(self, text):
@@ -604,80 +689,25 @@ class Rekordbox6Database:
         results.sort(key=lambda x: x.ID)
         return results
 
-    def get_cue(self, **kwargs):
-        """Creates a filtered query for the ``DjmdCue`` table."""
-        query = self.query(tables.DjmdCue).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_device(self, **kwargs):
-        """Creates a filtered query for the ``DjmdDevice`` table."""
-        query = self.query(tables.DjmdDevice).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_genre(self, **kwargs):
-        """Creates a filtered query for the ``DjmdGenre`` table."""
-        query = self.query(tables.DjmdGenre).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_history(self, **kwargs):
-        """Creates a filtered query for the ``DjmdHistory`` table."""
-        query = self.query(tables.DjmdHistory).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_history_songs(self, **kwargs):
-        """Creates a filtered query for the ``DjmdSongHistory`` table."""
-        query = self.query(tables.DjmdSongHistory).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_hot_cue_banklist(self, **kwargs):
-        """Creates a filtered query for the ``DjmdHotCueBanklist`` table."""
-        query = self.query(tables.DjmdHotCueBanklist).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_hot_cue_banklist_songs(self, **kwargs):
-        """Creates a filtered query for the ``DjmdSongHotCueBanklist`` table."""
-        query = self.query(tables.DjmdSongHotCueBanklist).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_key(self, **kwargs):
-        """Creates a filtered query for the ``DjmdKey`` table."""
-        query = self.query(tables.DjmdKey).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_label(self, **kwargs):
-        """Creates a filtered query for the ``DjmdLabel`` table."""
-        query = self.query(tables.DjmdLabel).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_menu_items(self, **kwargs):
-        """Creates a filtered query for the ``DjmdMenuItems`` table."""
-        query = self.query(tables.DjmdMenuItems).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_mixer_param(self, **kwargs):
-        """Creates a filtered query for the ``DjmdMixerParam`` table."""
-        query = self.query(tables.DjmdMixerParam).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_my_tag(self, **kwargs):
-        """Creates a filtered query for the ``DjmdMyTag`` table."""
-        query = self.query(tables.DjmdMyTag).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_my_tag_songs(self, **kwargs):
-        """Creates a filtered query for the ``DjmdSongMyTag`` table."""
-        query = self.query(tables.DjmdSongMyTag).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_playlist(self, **kwargs):
-        """Creates a filtered query for the ``DjmdPlaylist`` table."""
-        query = self.query(tables.DjmdPlaylist).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_playlist_songs(self, **kwargs):
-        """Creates a filtered query for the ``DjmdSongPlaylist`` table."""
-        query = self.query(tables.DjmdSongPlaylist).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
+    get_cue = _table_getter("get_cue", tables.DjmdCue)
+    get_device = _table_getter("get_device", tables.DjmdDevice)
+    get_genre = _table_getter("get_genre", tables.DjmdGenre)
+    get_history = _table_getter("get_history", tables.DjmdHistory)
+    get_history_songs = _table_getter("get_history_songs", tables.DjmdSongHistory)
+    get_hot_cue_banklist = _table_getter(
+        "get_hot_cue_banklist", tables.DjmdHotCueBanklist
+    )
+    get_hot_cue_banklist_songs = _table_getter(
+        "get_hot_cue_banklist_songs", tables.DjmdSongHotCueBanklist
+    )
+    get_key = _table_getter("get_key", tables.DjmdKey)
+    get_label = _table_getter("get_label", tables.DjmdLabel)
+    get_menu_items = _table_getter("get_menu_items", tables.DjmdMenuItems)
+    get_mixer_param = _table_getter("get_mixer_param", tables.DjmdMixerParam)
+    get_my_tag = _table_getter("get_my_tag", tables.DjmdMyTag)
+    get_my_tag_songs = _table_getter("get_my_tag_songs", tables.DjmdSongMyTag)
+    get_playlist = _table_getter("get_playlist", tables.DjmdPlaylist)
+    get_playlist_songs = _table_getter("get_playlist_songs", tables.DjmdSongPlaylist)
 
     def get_playlist_contents(self, playlist, *entities) -> Query:
         """Return the contents of a regular or smart playlist.
@@ -733,85 +763,30 @@ class Rekordbox6Database:
 
         return self.query(*entities).filter(filter_clause)
 
-    def get_property(self, **kwargs):
-        """Creates a filtered query for the ``DjmdProperty`` table."""
-        query = self.query(tables.DjmdProperty).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_related_tracks(self, **kwargs):
-        """Creates a filtered query for the ``DjmdRelatedTracks`` table."""
-        query = self.query(tables.DjmdRelatedTracks).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_related_tracks_songs(self, **kwargs):
-        """Creates a filtered query for the ``DjmdSongRelatedTracks`` table."""
-        query = self.query(tables.DjmdSongRelatedTracks).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_sampler(self, **kwargs):
-        """Creates a filtered query for the ``DjmdSampler`` table."""
-        query = self.query(tables.DjmdSampler).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_sampler_songs(self, **kwargs):
-        """Creates a filtered query for the ``DjmdSongSampler`` table."""
-        query = self.query(tables.DjmdSongSampler).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_tag_list_songs(self, **kwargs):
-        """Creates a filtered query for the ``DjmdSongTagList`` table."""
-        query = self.query(tables.DjmdSongTagList).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_sort(self, **kwargs):
-        """Creates a filtered query for the ``DjmdSort`` table."""
-        query = self.query(tables.DjmdSort).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_agent_registry(self, **kwargs):
-        """Creates a filtered query for the ``AgentRegistry`` table."""
-        query = self.query(tables.AgentRegistry).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_cloud_agent_registry(self, **kwargs):
-        """Creates a filtered query for the ``CloudAgentRegistry`` table."""
-        query = self.query(tables.CloudAgentRegistry).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_content_active_censor(self, **kwargs):
-        """Creates a filtered query for the ``ContentActiveCensor`` table."""
-        query = self.query(tables.ContentActiveCensor).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_content_cue(self, **kwargs):
-        """Creates a filtered query for the ``ContentCue`` table."""
-        query = self.query(tables.ContentCue).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_content_file(self, **kwargs):
-        """Creates a filtered query for the ``ContentFile`` table."""
-        query = self.query(tables.ContentFile).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_hot_cue_banklist_cue(self, **kwargs):
-        """Creates a filtered query for the ``HotCueBanklistCue`` table."""
-        query = self.query(tables.HotCueBanklistCue).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_image_file(self, **kwargs):
-        """Creates a filtered query for the ``ImageFile`` table."""
-        query = self.query(tables.ImageFile).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_setting_file(self, **kwargs):
-        """Creates a filtered query for the ``SettingFile`` table."""
-        query = self.query(tables.SettingFile).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
-
-    def get_uuid_map(self, **kwargs):
-        """Creates a filtered query for the ``UuidIDMap`` table."""
-        query = self.query(tables.UuidIDMap).filter_by(**kwargs)
-        return _parse_query_result(query, kwargs)
+    get_property = _table_getter("get_property", tables.DjmdProperty)
+    get_related_tracks = _table_getter("get_related_tracks", tables.DjmdRelatedTracks)
+    get_related_tracks_songs = _table_getter(
+        "get_related_tracks_songs", tables.DjmdSongRelatedTracks
+    )
+    get_sampler = _table_getter("get_sampler", tables.DjmdSampler)
+    get_sampler_songs = _table_getter("get_sampler_songs", tables.DjmdSongSampler)
+    get_tag_list_songs = _table_getter("get_tag_list_songs", tables.DjmdSongTagList)
+    get_sort = _table_getter("get_sort", tables.DjmdSort)
+    get_agent_registry = _table_getter("get_agent_registry", tables.AgentRegistry)
+    get_cloud_agent_registry = _table_getter(
+        "get_cloud_agent_registry", tables.CloudAgentRegistry
+    )
+    get_content_active_censor = _table_getter(
+        "get_content_active_censor", tables.ContentActiveCensor
+    )
+    get_content_cue = _table_getter("get_content_cue", tables.ContentCue)
+    get_content_file = _table_getter("get_content_file", tables.ContentFile)
+    get_hot_cue_banklist_cue = _table_getter(
+        "get_hot_cue_banklist_cue", tables.HotCueBanklistCue
+    )
+    get_image_file = _table_getter("get_image_file", tables.ImageFile)
+    get_setting_file = _table_getter("get_setting_file", tables.SettingFile)
+    get_uuid_map = _table_getter("get_uuid_map", tables.UuidIDMap)
 
     # -- Database updates --------------------------------------------------------------
 
@@ -820,16 +795,15 @@ class Rekordbox6Database:
     ) -> int:
         """Generates an unused ID for the given table."""
         max_tries = 1000000
+        id_field = getattr(table, id_field_name)
         for _ in range(max_tries):
             # Generate random ID
-            buf = secrets.token_bytes(4)
-            id_ = (buf[0] << 24) + (buf[1] << 16) + (buf[2] << 8) + buf[3] >> 0
+            id_ = int.from_bytes(secrets.token_bytes(4), "big")
             if is_28_bit:
                 id_ = id_ >> 4
             if id_ < 100:
                 continue
             # Check if ID is already used
-            id_field = getattr(table, id_field_name)
             query = self.query(id_field).filter(id_field == id_)
             used = self.query(query.exists()).scalar()
             if not used:
@@ -893,9 +867,9 @@ class Rekordbox6Database:
         id_ = str(uuid4())
         now = datetime.datetime.now()
         nsongs = (
-            self.query(tables.DjmdSongPlaylist)
+            self.query(func.count(tables.DjmdSongPlaylist.ID))
             .filter_by(PlaylistID=playlist.ID)
-            .count()
+            .scalar()
         )
         if track_no is not None:
             insert_at_end = False
@@ -955,6 +929,77 @@ class Rekordbox6Database:
 
         return song
 
+    def add_contents_to_playlist(self, playlist, contents):
+        """Adds multiple tracks to the end of a playlist.
+
+        Bulk version of :meth:`add_to_playlist`: The size of the playlist is only
+        queried once and all new :class:`DjmdSongPlaylist` objects are flushed
+        together.
+
+        Parameters
+        ----------
+        playlist : DjmdPlaylist or int or str
+            The playlist to add the tracks to. Can either be a :class:`DjmdPlaylist`
+            object or a playlist ID.
+        contents : Iterable[DjmdContent or int or str]
+            The contents to add to the playlist. Each item can either be a
+            :class:`DjmdContent` object or a content ID.
+
+        Returns
+        -------
+        songs: list[DjmdSongPlaylist]
+            The song playlist objects that were created from the contents.
+
+        Raises
+        ------
+        ValueError : If the playlist is a folder or smart playlist.
+        ValueError : If a content does not exist.
+
+        Examples
+        --------
+        >>> db = Rekordbox6Database()
+        >>> pid = 56789  # Playlist ID
+        >>> db.add_contents_to_playlist(pid, [12345, 23456])
+        [<DjmdSongPlaylist(...)>, <DjmdSongPlaylist(...)>]
+        """
+        if isinstance(playlist, (int, str)):
+            playlist = self.get_playlist(ID=playlist)
+        # Check playlist attribute (can't be folder or smart playlist)
+        if playlist.Attribute != 0:
+            raise ValueError("Playlist must be a normal playlist")
+
+        cids = [c.ID if isinstance(c, DjmdContent) else str(c) for c in contents]
+        # Check that all contents exist with a single query
+        query = self.query(DjmdContent.ID).filter(DjmdContent.ID.in_(set(cids)))
+        missing = set(cids).difference(cid for (cid,) in query)
+        if missing:
+            raise ValueError(f"Contents with IDs {sorted(missing)} do not exist")
+
+        pid = str(playlist.ID)
+        now = datetime.datetime.now()
+        nsongs = (
+            self.query(func.count(tables.DjmdSongPlaylist.ID))
+            .filter_by(PlaylistID=playlist.ID)
+            .scalar()
+        )
+        logger.info("Adding %s contents to playlist with ID=%s", len(cids), pid)
+
+        songs = list()
+        for track_no, cid in enumerate(cids, start=nsongs + 1):
+            song = tables.DjmdSongPlaylist.create(
+                ID=str(uuid4()),
+                PlaylistID=pid,
+                ContentID=cid,
+                TrackNo=track_no,
+                UUID=str(uuid4()),
+                created_at=now,
+                updated_at=now,
+            )
+            self.add(song)
+            songs.append(song)
+        self.flush()
+        return songs
+
     def remove_from_playlist(self, playlist, song):
         """Removes a track from a playlist.
 
@@ -1055,9 +1100,9 @@ class Rekordbox6Database:
         if isinstance(song, (int, str)):
             song = self.query(tables.DjmdSongPlaylist).filter_by(ID=song).one()
         nsongs = (
-            self.query(tables.DjmdSongPlaylist)
+            self.query(func.count(tables.DjmdSongPlaylist.ID))
             .filter_by(PlaylistID=playlist.ID)
-            .count()
+            .scalar()
         )
         if new_track_no < 1:
             raise ValueError("Track number must be greater than 0")
@@ -1141,7 +1186,7 @@ class Rekordbox6Database:
             if not self.query(query.exists()).scalar():
                 raise ValueError("Parent does not exist or is not a folder")
 
-        n = self.get_playlist(ParentID=parent_id).count()
+        n = self.query(func.count(table.ID)).filter_by(ParentID=parent_id).scalar()
         logger.debug("Parent playlist with ID=%s contains %s items", parent_id, n)
 
         if seq is None:
@@ -1486,7 +1531,7 @@ class Rekordbox6Database:
             if not self.query(query.exists()).scalar():
                 raise ValueError("Parent does not exist or is not a folder")
 
-        n = self.get_playlist(ParentID=parent_id).count()
+        n = self.query(func.count(table.ID)).filter_by(ParentID=parent_id).scalar()
         old_seq = playlist.Seq
 
         if parent_id != playlist.ParentID:
@@ -1697,7 +1742,7 @@ class Rekordbox6Database:
         """
         # Check if album already exists
         query = self.query(tables.DjmdAlbum).filter_by(Name=name)
-        if query.count() > 0:
+        if self.query(query.exists()).scalar():
             raise ValueError(f"Album '{name}' already exists in database")
 
         # Get artist ID
@@ -1768,7 +1813,7 @@ class Rekordbox6Database:
         """
         # Check if artist already exists
         query = self.query(tables.DjmdArtist).filter_by(Name=name)
-        if query.count() > 0:
+        if self.query(query.exists()).scalar():
             raise ValueError(f"Artist '{name}' already exists in database")
 
         id_ = self.generate_unused_id(tables.DjmdArtist)
@@ -1820,7 +1865,7 @@ class Rekordbox6Database:
         """
         # Check if genre already exists
         query = self.query(tables.DjmdGenre).filter_by(Name=name)
-        if query.count() > 0:
+        if self.query(query.exists()).scalar():
             raise ValueError(f"Genre '{name}' already exists in database")
 
         id_ = self.generate_unused_id(tables.DjmdGenre)
@@ -1870,7 +1915,7 @@ class Rekordbox6Database:
         """
         # Check if label already exists
         query = self.query(tables.DjmdLabel).filter_by(Name=name)
-        if query.count() > 0:
+        if self.query(query.exists()).scalar():
             raise ValueError(f"Label '{name}' already exists in database")
 
         id_ = self.generate_unused_id(tables.DjmdLabel)
@@ -1890,7 +1935,8 @@ class Rekordbox6Database:
 
         **kwargs:
             Keyword arguments passed to DjmdContent on creation. These arguments
-            should be a valid DjmdContent field.
+            should be a valid DjmdContent field. If `FileNameL` or `FileSize` are
+            given, they are used instead of reading them from the file system.
 
         Returns
         -------
@@ -1912,8 +1958,8 @@ class Rekordbox6Database:
         """
         path = Path(path)
         path_string = str(path)
-        query = self.query(tables.DjmdContent).filter_by(FolderPath=path_string)
-        if query.count() > 0:
+        result = self.session.execute(_CONTENT_BY_PATH, {"path": path_string})
+        if result.first() is not None:
             raise ValueError(f"Track with path '{path}' already exists in database")
 
         id_ = self.generate_unused_id(tables.DjmdContent)
@@ -1924,8 +1970,10 @@ class Rekordbox6Database:
         content_link = self.get_menu_items(Name="TRACK").one()
         date_created = datetime.date.today()
         device = self.get_device().first()
-        file_name_l = path.name
-        file_size = path.stat().st_size
+        file_name_l = kwargs.pop("FileNameL", None) or path.name
+        file_size = kwargs.pop("FileSize", None)
+        if file_size is None:
+            file_size = path.stat().st_size
 
         file_type_string = path.suffix.lstrip(".").upper()
         try:
@@ -2225,6 +2273,34 @@ class Rekordbox6Database:
         new_path = new_path.with_suffix(ext)
         self.update_content_path(content, new_path, save, check_path, commit=commit)
 
+    def _iter_table_data(self, table_names=None, verbose=False):
+        """Yields the name and the data (a list of row dicts) of each database table.
+
+        Parameters
+        ----------
+        table_names : list[str], optional
+            The names of the tables to convert. By default, all tables in
+            ``tables.TABLES`` are used.
+        verbose: bool, optional
+            If True, print the name of the table that is currently converted.
+        """
+        if table_names is None:
+            table_names = tables.TABLES
+        for table_name in table_names:
+            if table_name.startswith("Stats") or table_name == "Base":
+                continue
+            if verbose:
+                print(f"Converting table: {table_name}")
+            table = getattr(tables, table_name)
+            columns = table.columns()
+            # Select the plain column values to skip building ORM instances and
+            # fetch the rows in batches instead of buffering the whole result
+            stmt = select(*[getattr(table, column) for column in columns])
+            stmt = stmt.execution_options(yield_per=1000)
+            result = self.session.execute(stmt)
+            table_data = [dict(zip(columns, row)) for row in result]
+            yield table_name, table_data
+
     def to_dict(self, verbose=False):
         """Convert the database to a dictionary.
 
@@ -2239,22 +2315,15 @@ class Rekordbox6Database:
             A dictionary containing the database tables as keys and the table data as
             a list of dicts.
         """
-        data = dict()
-        for table_name in tables.TABLES:
-            if table_name.startswith("Stats") or table_name == "Base":
-                continue
-            if verbose:
-                print(f"Converting table: {table_name}")
-            table = getattr(tables, table_name)
-            columns = table.columns()
-            table_data = list()
-            for row in self.query(table).all():
-                table_data.append({column: row[column] for column in columns})
-            data[table_name] = table_data
-        return data
+        return dict(self._iter_table_data(verbose=verbose))
 
     def to_json(self, file, indent=4, sort_keys=True, verbose=False):
-        """Convert the database to a JSON file."""
+        """Convert the database to a JSON file.
+
+        The tables are converted and written one after another, so only the data of
+        a single table is held in memory at a time. The output is the same as
+        dumping the dictionary returned by :meth:`to_dict`.
+        """
         import json
 
         def json_serial(obj):
@@ -2262,9 +2331,21 @@ class Rekordbox6Database:
                 return obj.isoformat()
             raise TypeError(f"Type {type(obj)} not serializable")
 
-        data = self.to_dict(verbose=verbose)
+        encoder = json.JSONEncoder(
+            indent=indent, sort_keys=sort_keys, default=json_serial
+        )
+        table_names = sorted(tables.TABLES) if sort_keys else None
+        items = self._iter_table_data(table_names, verbose)
+        sep = ", " if indent is None else ","
         with open(file, "w") as fp:
-            json.dump(data, fp, indent=indent, sort_keys=sort_keys, default=json_serial)
+            fp.write("{")
+            for i, (name, table_data) in enumerate(items):
+                # Encode each table as a single item dict and strip the braces
+                item = encoder.encode({name: table_data})[1:-1]
+                if indent is not None:
+                    item = item[:-1]  # Strip newline before closing brace
+                fp.write(item if i == 0 else sep + item)
+            fp.write("}" if indent is None else "\n}")
 
     def copy_unlocked(self, output_file):
         src_engine = self.engine
@@ -2305,13 +2386,16 @@ class Rekordbox6Database:
         # Copy all data from src to target
         print("Copying data...")
         string = "\rCopying table {name}: Inserting row {row}"
-        index = 0
         for table in dst_metadata.sorted_tables:
             src_table = src_metadata.tables[table.name]
             stmt = table.insert()
-            for index, row in enumerate(src_conn.execute(src_table.select())):
+            index = 0
+            result = src_conn.execute(src_table.select()).mappings()
+            # Insert the rows in batches (executemany) using the same statement
+            for rows in result.partitions(1000):
                 print(string.format(name=table.name, row=index), end="", flush=True)
-                dst_conn.execute(stmt.values(row))
+                dst_conn.execute(stmt, [dict(row) for row in rows])
+                index += len(rows)
             print(f"\rCopying table {table.name}: Inserted {index} rows", flush=True)
 
         dst_conn.commit()
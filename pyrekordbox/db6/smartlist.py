@@ -154,11 +154,11 @@ PROPERTY_COLUMN_MAP = {
 
 TYPE_CONVERSION = {
     Property.BPM: int,
-    Property.STOCK_DATE: lambda x: datetime.strptime(x, "%Y-%m-%d"),
-    Property.DATE_CREATED: lambda x: datetime.strptime(x, "%Y-%m-%d"),
+    Property.STOCK_DATE: datetime.fromisoformat,
+    Property.DATE_CREATED: datetime.fromisoformat,
     Property.COUNTER: int,
     Property.RATING: int,
-    Property.DATE_RELEASED: lambda x: datetime.strptime(x, "%Y-%m-%d"),
+    Property.DATE_RELEASED: datetime.fromisoformat,
     Property.DURATION: int,
     Property.YEAR: int,
 }
@@ -4,11 +4,12 @@
 
 """Rekordbox 6 `master.db` SQLAlchemy table declarations."""
 
+import functools
 import math
 import struct
 from datetime import datetime
 from enum import IntEnum
-from typing import List
+from typing import List, Tuple
 
 import numpy as np
 from sqlalchemy import (
@@ -23,7 +24,6 @@ from sqlalchemy import (
     TypeDecorator,
 )
 from sqlalchemy.ext.associationproxy import association_proxy
-from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import DeclarativeBase, Mapped, backref, mapped_column, relationship
 
 from .registry import RekordboxAgentRegistry
@@ -114,6 +114,31 @@ TABLES = [
 ]
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_datetime(value):
+    """Parses a datetime string of the database.
+
+    Many rows share the same timestamps, so the parsed (immutable) datetime
+    objects are cached.
+    """
+    if value.endswith(" +00:00"):
+        # Default format of the database, which is not supported by `fromisoformat`.
+        # Handle it directly instead of going through the exception below
+        return datetime.fromisoformat(value[:-7])
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        if len(value.strip()) > 23:
+            datestr, tzinfo = value[:23], value[23:]
+            datestr = datestr.strip()
+            tzinfo = tzinfo.strip()
+            assert tzinfo == "+00:00", tzinfo
+        else:
+            datestr, tzinfo = value, ""
+        dt = datetime.fromisoformat(datestr)
+    return dt
+
+
 class DateTime(TypeDecorator):
     """Custom datetime column with timezone support.
 
@@ -126,22 +151,11 @@ class DateTime(TypeDecorator):
     cache_ok = True
 
     def process_bind_param(self, value, dialect):
-        return value.isoformat().replace("T", " ")[:-3] + " +00:00"
+        return f"{value:%Y-%m-%d %H:%M:%S.%f}"[:-3] + " +00:00"
 
     def process_result_value(self, value, dialect):
         if value:
-            try:
-                dt = datetime.fromisoformat(value)
-            except ValueError:
-                if len(value.strip()) > 23:
-                    datestr, tzinfo = value[:23], value[23:]
-                    datestr = datestr.strip()
-                    tzinfo = tzinfo.strip()
-                    assert tzinfo == "+00:00", tzinfo
-                else:
-                    datestr, tzinfo = value, ""
-                dt = datetime.fromisoformat(datestr)
-            return dt
+            return _parse_datetime(value)
         return None
 
 
@@ -167,7 +181,9 @@ class Base(DeclarativeBase):
     """Base class used to initialize the declarative base for all tables."""
 
     __tablename__: str
-    __keys__: List[str] = []
+    __keys__: List[str]
+    __columns__: Tuple[str, ...]
+    __relationships__: Tuple[str, ...]
 
     @classmethod
     def create(cls, **kwargs):
@@ -178,13 +194,17 @@ class Base(DeclarativeBase):
 
     @classmethod
     def columns(cls):
-        """Returns a list of all column names without the relationships."""
-        return [column.name for column in inspect(cls).c]
+        """Returns a tuple of all column names without the relationships."""
+        if "__columns__" not in cls.__dict__:  # Cache the names per table
+            cls.__columns__ = tuple(cls.__table__.columns.keys())
+        return cls.__columns__
 
     @classmethod
     def relationships(cls):
-        """Returns a list of all relationship names."""
-        return [column.key for column in inspect(cls).relationships]  # noqa
+        """Returns a tuple of all relationship names."""
+        if "__relationships__" not in cls.__dict__:  # Cache the names per table
+            cls.__relationships__ = tuple(cls.__mapper__.relationships.keys())
+        return cls.__relationships__
 
     @classmethod
     def __get_keys__(cls):
@@ -196,7 +216,7 @@ class Base(DeclarativeBase):
     @classmethod
     def keys(cls):
         """Returns a list of all column names including the relationships."""
-        if not cls.__keys__:  # Cache the keys
+        if "__keys__" not in cls.__dict__:  # Cache the keys per table
             cls.__keys__ = cls.__get_keys__()
         return cls.__keys__
 
@@ -205,10 +225,10 @@ class Base(DeclarativeBase):
         return iter(self.keys())
 
     def __len__(self):
-        return sum(1 for _ in self.__iter__())
+        return len(self.keys())
 
     def __getitem__(self, item):
-        return self.__getattribute__(item)
+        return getattr(self, item)
 
     # noinspection PyUnresolvedReferences
     def __setattr__(self, key, value):
@@ -218,22 +238,22 @@ class Base(DeclarativeBase):
 
     def values(self):
         """Returns a list of all column values including the relationships."""
-        return [self.__getitem__(key) for key in self.keys()]
+        return [getattr(self, key) for key in self.keys()]
 
     def items(self):
         for key in self.__iter__():
-            yield key, self.__getitem__(key)
+            yield key, getattr(self, key)
 
     def to_dict(self):
         """Returns a dictionary of all column names and values."""
-        return {key: self.__getitem__(key) for key in self.columns()}
+        return {key: getattr(self, key) for key in self.columns()}
 
     def pformat(self, indent="   "):
         lines = [f"{self.__tablename__}"]
         columns = self.columns()
-        w = max(len(col) for col in columns)
+        w = max(map(len, columns))
         for col in columns:
-            lines.append(f"{indent}{col:<{w}} {self.__getitem__(col)}")
+            lines.append(f"{indent}{col:<{w}} {getattr(self, col)}")
         return "\n".join(lines)
 
 
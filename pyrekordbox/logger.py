@@ -2,21 +2,46 @@
 # Author: Dylan Jones
 # Date:   2022-04-10
 
-"""Package logger configuration."""
+"""Package logger configuration.
+
+Only a :class:`logging.NullHandler` is attached to the package logger, so that
+applications using pyrekordbox can configure the log output themselves. Call
+:func:`configure_logging` to print the log messages to the console.
+"""
 
 import logging
 
 logger = logging.getLogger("pyrekordbox")
-
-# Logging format
-frmt = "[%(asctime)s] %(name)s:%(levelname)-8s - %(message)s"
-formatter = logging.Formatter(frmt, datefmt="%H:%M:%S")
-
-# Set up console logger
-sh = logging.StreamHandler()
-sh.setLevel(logging.DEBUG)
-sh.setFormatter(formatter)
-logger.addHandler(sh)
+logger.addHandler(logging.NullHandler())
 
 # Set logging level
 logger.setLevel(logging.WARNING)
+
+_stream_handler = None
+
+
+def configure_logging(level=logging.WARNING):
+    """Sets up a console handler for the package logger.
+
+    Calling the function again only updates the logging level.
+
+    Parameters
+    ----------
+    level : int or str, optional
+        The logging level of the package logger. The default is ``WARNING``.
+    """
+    global _stream_handler
+
+    if _stream_handler is None:
+        # Logging format
+        frmt = "[%(asctime)s] %(name)s:%(levelname)-8s - %(message)s"
+        formatter = logging.Formatter(frmt, datefmt="%H:%M:%S")
+
+        # Set up console logger
+        _stream_handler = logging.StreamHandler()
+        _stream_handler.setLevel(logging.DEBUG)
+        _stream_handler.setFormatter(formatter)
+        logger.addHandler(_stream_handler)
+
+    # Set logging level
+    logger.setLevel(level)
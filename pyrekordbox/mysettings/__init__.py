@@ -2,7 +2,7 @@
 # Author: Dylan Jones
 # Date:   2023-02-01
 
-import re
+import os
 from pathlib import Path
 
 from . import structs
@@ -15,19 +15,32 @@ from .file import (
     SettingsFile,
 )
 
-RE_MYSETTING = re.compile(".*SETTING[0-9]?.DAT$")
-
 
 def get_mysetting_paths(root, deep=False):
     files = list()
-    root = Path(root)
-    iteator = root.rglob("*") if deep else root.iterdir()
-    for path in iteator:
-        if path.is_file() and RE_MYSETTING.match(path.name):
-            files.append(path)
+    root = os.fspath(root)
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            it = os.scandir(directory)
+        except PermissionError:
+            # Skip unreadable sub-directories like `rglob` (e.g. on USB drives)
+            if directory == root:
+                raise
+            continue
+        # `DirEntry` caches the file type, so no extra stat call is needed per entry
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if deep:
+                        stack.append(entry.path)
+                elif entry.name.upper() in FILES and entry.is_file():
+                    files.append(Path(entry.path))
     return files
 
 
 def read_mysetting_file(path) -> SettingsFile:
-    obj = FILES[str(Path(path).name)]
+    # File names are matched case-insensitively, like in `get_mysetting_paths`
+    obj = FILES[os.path.basename(os.fspath(path)).upper()]
     return obj.parse_file(path)
@@ -124,6 +124,11 @@ class AbstractElement(abc.Mapping):
     AbstractElement.set
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Set of the attribute keys for fast membership checks in `get` and `set`
+        cls._attrib_keys = frozenset(getattr(cls, "ATTRIBS", ()))
+
     def __init__(self, element=None, *args, **kwargs):
         self._element = element
         if element is None:
@@ -165,16 +170,15 @@ class AbstractElement(abc.Mapping):
         XmlAttributeKeyError:
             Raised if `key` is not a valid attribute key.
         """
-        if key not in self.ATTRIBS:
+        if key not in self._attrib_keys:
             raise XmlAttributeKeyError(self.__class__, key, self.ATTRIBS)
         value = self._element.attrib.get(key, default)
         if value == default:
             return default
-        try:
-            # Apply callback
-            value = self.GETTERS[key](value)
-        except KeyError:
-            pass
+        # Apply callback
+        func = self.GETTERS.get(key)
+        if func is not None:
+            value = func(value)
         return value
 
     def set(self, key, value):
@@ -197,12 +201,13 @@ class AbstractElement(abc.Mapping):
         XmlAttributeKeyError:
             Raised if `key` is not a valid attribute key.
         """
-        if key not in self.ATTRIBS:
+        if key not in self._attrib_keys:
             raise XmlAttributeKeyError(self.__class__, key, self.ATTRIBS)
-        try:
-            # Apply callback
-            value = self.SETTERS[key](value)
-        except KeyError:
+        # Apply callback
+        func = self.SETTERS.get(key)
+        if func is not None:
+            value = func(value)
+        else:
             # Convert to str just in case
             value = str(value)
         self._element.attrib[key] = value
@@ -496,7 +501,7 @@ class Track(AbstractElement):
     def _init(self, parent, Location, **kwargs):
         attrib = {"Location": encode_path(Location)}
         for key, val in kwargs.items():
-            if key not in self.ATTRIBS:
+            if key not in self._attrib_keys:
                 raise XmlAttributeKeyError(self.__class__, key, self.ATTRIBS)
             attrib[key] = str(val)
         self._element = xml.SubElement(parent, self.TAG, attrib=attrib)
@@ -778,10 +783,10 @@ class Node:
         name : str
             The name of the playlist to remove.
         """
-        item = self.get_playlist(name)
-        self._element.remove(item._element)  # noqa
+        # Only search the direct children, nested nodes can't be removed from here
+        el = self._element.find(f'{self.TAG}[@Name="{name}"]')
+        self._element.remove(el)
         self._update_count()
-        self._update_entries()
 
     def add_track(self, key):
         """Adds a new track to the playlist node.
@@ -814,6 +819,34 @@ class Node:
         self._update_entries()
         return el
 
+    def remove_tracks(self, keys):
+        """Removes multiple tracks from the playlist node.
+
+        All entries of the given keys are removed in a single pass over the
+        playlist, which is faster than calling :meth:`remove_track` for each key.
+
+        Parameters
+        ----------
+        keys : Iterable[int or str]
+            The keys of the tracks to remove, depending on the `type` attribute of
+            the playlist node.
+
+        Returns
+        -------
+        removed : list[xml.Element]
+            The removed playlist track elements.
+        """
+        keys = {str(key) for key in keys}
+        kept, removed = list(), list()
+        for el in self._element:
+            if el.attrib["Key"] in keys:
+                removed.append(el)
+            else:
+                kept.append(el)
+        self._element[:] = kept
+        self._update_entries()
+        return removed
+
     def get_tracks(self):
         """Returns the keys of all tracks contained in the playlist node.
 
@@ -825,13 +858,10 @@ class Node:
         """
         if self.type == self.FOLDER:
             return list()
-        elements = self._element.findall(f".//{Track.TAG}")
-        items = list()
-        for el in elements:
-            val = el.attrib["Key"]
-            if self.key_type == "TrackID":
-                val = int(val)
-            items.append(val)
+        elements = self._element.iterfind(f".//{Track.TAG}")
+        items = [el.attrib["Key"] for el in elements]
+        if self.key_type == "TrackID":
+            items = [int(val) for val in items]
         return items
 
     def get_track(self, key):
@@ -858,14 +888,14 @@ class Node:
             The formatted tree string.
         """
         space = indent * lvl * " "
-        string = ""
+        parts = list()
         if self.type == self.PLAYLIST:
-            string += space + f"Playlist: {self.name} ({self.entries} Tracks)\n"
+            parts.append(space + f"Playlist: {self.name} ({self.entries} Tracks)\n")
         elif self.type == self.FOLDER:
-            string += space + f"Folder: {self.name}\n"
+            parts.append(space + f"Folder: {self.name}\n")
             for node in self.get_playlists():
-                string += node.treestr(indent, lvl + 1)
-        return string
+                parts.append(node.treestr(indent, lvl + 1))
+        return "".join(parts)
 
     def __eq__(self, other):
         return self.parent == other.parent and self.name == other.name
@@ -1122,10 +1152,14 @@ class RekordboxXml:
 
     def _update_cache(self):
         """Update the cache with the current tracks in the collection."""
-        self._locations.clear()
-        self._ids.clear()
-        for track in self.get_tracks():
-            self._add_cache(track)
+        # Read the raw attributes instead of creating a `Track` object per element
+        elements = self._collection.iterfind(f".//{Track.TAG}")
+        attribs = [el.attrib for el in elements]
+        self._locations = {
+            decode_path(a["Location"]) for a in attribs if "Location" in a
+        }
+        self._ids = {int(a["TrackID"]) for a in attribs if "TrackID" in a}
+        self._last_id = max(self._ids, default=0)
 
     def add_track(self, location, **kwargs):
         """Add a new track element to the Rekordbox XML collection.
@@ -1166,7 +1200,7 @@ class RekordboxXml:
 
         # Create track and add it to the collection
         track = Track(self._collection, location, **kwargs)
-        self._last_id = int(track["TrackID"])
+        self._last_id = max(self._last_id, int(track["TrackID"]))
         self._increment_track_count()
         self._add_cache(track)
         return track
@@ -2,7 +2,19 @@
 # Author: Dylan Jones
 # Date:   2022-04-10
 
-from .rbxml import *  # noqa: F401, F403
+from . import rbxml as _rbxml
 from .utils import warn_deprecated as _warn_deprecated
 
-_warn_deprecated("pyrekordbox.xml", "pyrekordbox.rbxml", remove_in="0.4.0")
+
+def __getattr__(name):
+    # Forward the names of `rbxml` lazily and only warn when one is actually used
+    if name.startswith("__") and name != "__all__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _warn_deprecated("pyrekordbox.xml", "pyrekordbox.rbxml", remove_in="0.4.0")
+    if name == "__all__":
+        return [key for key in dir(_rbxml) if not key.startswith("_")]
+    return getattr(_rbxml, name)
+
+
+def __dir__():
+    return dir(_rbxml)
@@ -2,9 +2,12 @@
 # Author: Dylan Jones
 # Date:   2023-02-01
 
+import gc
+import json
 import os
 import shutil
 import tempfile
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -61,6 +64,80 @@ def test_close_open():
     db.close()
 
 
+def test_shared_engine(tmp_path):
+    path = tmp_path / "master.db"
+    shutil.copy(UNLOCKED, path)
+    db1 = Rekordbox6Database(path, unlock=False)
+    db2 = Rekordbox6Database(path, unlock=False)
+    assert db1.engine is db2.engine
+    # The engine is kept as long as a handler using it is open
+    db1.close()
+    db3 = Rekordbox6Database(path, unlock=False)
+    assert db3.engine is db2.engine
+    db2.close()
+    db3.close()
+    # Closing the last handler drops the engine from the cache
+    db4 = Rekordbox6Database(path, unlock=False)
+    assert db4.engine is not db1.engine
+    db4.close()
+
+
+def _count_open_handles(path):
+    path = os.path.realpath(path)
+    count = 0
+    for fd in os.listdir("/proc/self/fd"):
+        try:
+            if os.readlink(os.path.join("/proc/self/fd", fd)) == path:
+                count += 1
+        except OSError:
+            pass
+    return count
+
+
+@mark.skipif(not os.path.isdir("/proc/self/fd"), reason="Requires /proc/self/fd")
+def test_shared_engine_close_handles(tmp_path):
+    path = tmp_path / "master.db"
+    shutil.copy(UNLOCKED, path)
+    # Open handles must be closed without relying on the garbage collector
+    gc.disable()
+    try:
+        db1 = Rekordbox6Database(path, unlock=False)
+        db2 = Rekordbox6Database(path, unlock=False)
+        db1.get_content().first()
+        db2.get_content().first()
+        db1.close()
+        db2.get_content().first()
+        db2.close()
+        assert _count_open_handles(path) == 0
+    finally:
+        gc.enable()
+
+
+def test_engine_replaced_file(tmp_path):
+    path = tmp_path / "master.db"
+    new_path = tmp_path / "master_new.db"
+    shutil.copy(UNLOCKED, path)
+    shutil.copy(UNLOCKED, new_path)
+    name = "Replaced Artist"
+
+    # Add an artist that only exists in the new file
+    db = Rekordbox6Database(new_path, unlock=False)
+    db.add_artist(name)
+    db.commit()
+    db.close()
+
+    db = Rekordbox6Database(path, unlock=False)
+    assert db.get_artist(Name=name).one_or_none() is None
+    db.close()
+    del db
+
+    # Replace the file, e.g. when restoring a backup
+    os.replace(new_path, path)
+    db = Rekordbox6Database(path, unlock=False)
+    assert db.get_artist(Name=name).one().Name == name
+    db.close()
+
+
 @mark.parametrize(
     "name,cls",
     [
@@ -98,6 +175,9 @@ def test_close_open():
 )
 def test_getter(name, cls):
     getter = getattr(DB, name)
+    # Generated getters report their public method name
+    assert getter.__name__ == name
+    assert getter.__qualname__ == f"Rekordbox6Database.{name}"
     # Test return is query
     query = getter()
     assert isinstance(query, Query)
@@ -207,6 +287,21 @@ def test_mixer_gain_setters(db):
         assert item.PeakHigh == high
 
 
+@mark.parametrize(
+    "value,string",
+    [
+        (datetime(2023, 8, 7, 12, 30, 15, 123456), "2023-08-07 12:30:15.123 +00:00"),
+        (datetime(2023, 8, 7, 12, 30, 15), "2023-08-07 12:30:15.000 +00:00"),
+    ],
+)
+def test_datetime_column(value, string):
+    column = tables.DateTime()
+    assert column.process_bind_param(value, None) == string
+    assert column.process_result_value(string, None) == value.replace(
+        microsecond=value.microsecond // 1000 * 1000
+    )
+
+
 @mark.parametrize(
     "search,ids",
     [
@@ -332,6 +427,32 @@ def test_add_song_to_playlist_trackno_end(db):
     assert _check_playlist_xml(db)
 
 
+def test_add_contents_to_playlist(db):
+    old_usn = db.get_local_usn()
+    flushes = list()
+    db.register_event("after_flush", lambda *args: flushes.append(args))
+
+    songs = db.add_contents_to_playlist(
+        PID1, [CID1, str(CID2), db.get_content(ID=CID3)]
+    )
+    assert len(flushes) == 1
+    db.commit()
+
+    assert [song.TrackNo for song in songs] == [1, 2, 3]
+    assert [song.ContentID for song in songs] == [str(CID1), str(CID2), str(CID3)]
+    assert len(db.get_playlist(ID=PID1).Songs) == 3
+    assert db.get_local_usn() == old_usn + 3
+
+    # Appends to the existing songs
+    song = db.add_contents_to_playlist(PID1, [CID4])[0]
+    assert song.TrackNo == 4
+
+    with pytest.raises(ValueError):
+        db.add_contents_to_playlist(PID1, [CID1, 1234])
+
+    assert _check_playlist_xml(db)
+
+
 def test_add_song_to_playlist_trackno_middle(db):
     song1 = db.add_to_playlist(PID1, CID1)
     song2 = db.add_to_playlist(PID1, CID2)
@@ -1156,6 +1277,24 @@ def test_add_label(db):
         db.add_label(name)
 
 
+def test_add_content(db):
+    path = Path("C:/Music/Tracks/new_track.mp3")
+    # The file doesn't exist, so the file size has to be provided
+    content = db.add_content(path, Title="New Track", FileSize=1234)
+    assert content.FolderPath == str(path)
+    assert content.FileNameL == "new_track.mp3"
+    assert content.FileSize == 1234
+    assert content.FileType == tables.FileType.MP3
+    db.commit()
+
+    instance = db.get_content(ID=content.ID)
+    assert instance.Title == "New Track"
+
+    # Fail if content with same path is added
+    with pytest.raises(ValueError):
+        db.add_content(path, FileSize=1234)
+
+
 def test_get_anlz_paths():
     content = DB.get_content().first()
 
@@ -1175,6 +1314,27 @@ def test_to_json():
         os.remove(tmp.name)
 
 
+def _json_serial(obj):
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+@mark.parametrize("indent", [4, None])
+@mark.parametrize("sort_keys", [True, False])
+def test_to_json_output(tmp_path, indent, sort_keys):
+    # The streamed output has to match dumping the dict of `to_dict`
+    path = tmp_path / "db.json"
+    DB.to_json(path, indent=indent, sort_keys=sort_keys)
+    expected = json.dumps(
+        DB.to_dict(), indent=indent, sort_keys=sort_keys, default=_json_serial
+    )
+    with open(path) as fp:
+        text = fp.read()
+    assert json.loads(text) == json.loads(expected)
+    assert text == expected
+
+
 def test_copy_unlocked():
     db = Rekordbox6Database(UNLOCKED, unlock=False)
     db.copy_unlocked(UNLOCKED_OUT)
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# Author: Dylan Jones
+# Date:   2026-10-17
+
+import importlib
+import logging
+
+import pytest
+
+from pyrekordbox import configure_logging, logger
+
+# `pyrekordbox.logger` is shadowed by the logger instance in the package namespace
+logger_module = importlib.import_module("pyrekordbox.logger")
+
+
+@pytest.fixture
+def restore_logger():
+    handlers = list(logger.handlers)
+    level = logger.level
+    yield
+    for handler in list(logger.handlers):
+        if handler not in handlers:
+            logger.removeHandler(handler)
+    logger_module._stream_handler = None
+    logger.setLevel(level)
+
+
+def test_default_handler():
+    assert any(isinstance(h, logging.NullHandler) for h in logger.handlers)
+
+
+def test_configure_logging(restore_logger):
+    num_handlers = len(logger.handlers)
+
+    configure_logging(logging.INFO)
+    assert len(logger.handlers) == num_handlers + 1
+    assert isinstance(logger.handlers[-1], logging.StreamHandler)
+    assert logger.level == logging.INFO
+
+    # Calling it again only updates the level
+    handler = logger.handlers[-1]
+    configure_logging("DEBUG")
+    assert len(logger.handlers) == num_handlers + 1
+    assert logger.handlers[-1] is handler
+    assert logger.level == logging.DEBUG
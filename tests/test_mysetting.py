@@ -3,13 +3,16 @@
 # Date:   2022-10-25
 
 import os
+from pathlib import Path
 
 import pytest
 
 from pyrekordbox.mysettings import (
+    FILES,
     DjmMySettingFile,
     MySetting2File,
     MySettingFile,
+    get_mysetting_paths,
     read_mysetting_file,
 )
 from pyrekordbox.mysettings.file import compute_checksum
@@ -203,3 +206,82 @@ def test_mysetting_checksum():
             data = sett.build()
             checksum = compute_checksum(data, sett.struct)
             assert checksum == sett.parsed.checksum
+
+
+def test_read_mysetting_file_lowercase(tmp_path):
+    src = os.path.join(TEST_ROOT, "mysettings", "MYSETTING.DAT")
+    path = tmp_path / "mysetting.dat"
+    with open(src, "rb") as fh:
+        path.write_bytes(fh.read())
+
+    sett = read_mysetting_file(path)
+    assert isinstance(sett, MySettingFile)
+    assert sett.build() == path.read_bytes()
+
+
+def test_get_mysetting_paths():
+    root = os.path.join(TEST_ROOT, "mysettings")
+    paths = get_mysetting_paths(root)
+    assert sorted(p.name for p in paths) == sorted(FILES.keys())
+    assert all(p.parent == Path(root) for p in paths)
+
+
+def test_get_mysetting_paths_deep():
+    root = os.path.join(TEST_ROOT, "mysettings")
+    expected = set()
+    for dirpath, _, files in os.walk(root):
+        for name in files:
+            if name in FILES:
+                expected.add(Path(dirpath) / name)
+
+    paths = get_mysetting_paths(root, deep=True)
+    assert len(paths) == len(expected)
+    assert set(paths) == expected
+
+
+def test_get_mysetting_paths_lowercase(tmp_path):
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (tmp_path / "mysetting.dat").write_bytes(b"")
+    (tmp_path / "OTHER.DAT").write_bytes(b"")
+    (sub / "Djmmysetting.dat").write_bytes(b"")
+
+    assert get_mysetting_paths(tmp_path) == [tmp_path / "mysetting.dat"]
+    paths = get_mysetting_paths(tmp_path, deep=True)
+    assert set(paths) == {tmp_path / "mysetting.dat", sub / "Djmmysetting.dat"}
+
+
+def test_get_mysetting_paths_symlink(tmp_path):
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "MYSETTING.DAT").write_bytes(b"")
+    root = tmp_path / "root"
+    root.mkdir()
+    try:
+        (root / "link").symlink_to(target, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("Symlinks are not supported")
+
+    # Symlinked directories are not followed
+    assert get_mysetting_paths(root, deep=True) == []
+
+
+def test_get_mysetting_paths_permission_error(tmp_path, monkeypatch):
+    denied = tmp_path / "System Volume Information"
+    denied.mkdir()
+    (denied / "MYSETTING.DAT").write_bytes(b"")
+    (tmp_path / "MYSETTING.DAT").write_bytes(b"")
+
+    scandir = os.scandir
+
+    def _scandir(path):
+        if os.fspath(path) in (str(denied), str(tmp_path / "root")):
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", _scandir)
+    # Unreadable sub-directories are skipped
+    assert get_mysetting_paths(tmp_path, deep=True) == [tmp_path / "MYSETTING.DAT"]
+    # An unreadable root still raises
+    with pytest.raises(PermissionError):
+        get_mysetting_paths(tmp_path / "root", deep=True)
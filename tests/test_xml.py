@@ -2,7 +2,10 @@
 # Author: Dylan Jones
 # Date:   2022-05-07
 
+import importlib
 import os
+import sys
+import warnings
 
 import pytest
 
@@ -483,6 +486,12 @@ def test_add_track():
     track4 = xml.add_track("C:/path/to/file4.wav")
     assert track4.TrackID == 11
 
+    # test auto-increment after lower manual TrackID
+    track5 = xml.add_track("C:/path/to/file5.wav", TrackID=5)
+    assert track5.TrackID == 5
+    track6 = xml.add_track("C:/path/to/file6.wav")
+    assert track6.TrackID == 12
+
     # Location exists
     with pytest.raises(XmlDuplicateError):
         xml.add_track("C:/path/to/file1.wav")
@@ -492,6 +501,13 @@ def test_add_track():
         xml.add_track("C:/path/to/file_new.wav", TrackID=track1.TrackID)
 
 
+def test_add_track_parsed():
+    xml = RekordboxXml(XML5)
+    last_id = max(xml.get_track_ids())
+    track = xml.add_track("C:/path/to/new_file.wav")
+    assert track.TrackID == last_id + 1
+
+
 def test_update_track_count():
     xml = RekordboxXml()
     track1 = xml.add_track("C:/path/to/file1.wav")
@@ -612,6 +628,31 @@ def test_update_folder_count():
 
     folder.remove_playlist("F1")
     assert folder.count == 0
+    assert "Entries" not in folder._element.attrib
+
+
+def test_remove_tracks():
+    xml = RekordboxXml()
+    playlist = xml.add_playlist("Playlist")
+    for key in range(5):
+        playlist.add_track(key)
+
+    removed = playlist.remove_tracks([1, 3])
+    assert len(removed) == 2
+    assert playlist.entries == 3
+    assert playlist.get_tracks() == [0, 2, 4]
+
+
+def test_remove_playlist_nested_name():
+    xml = RekordboxXml()
+    folder = xml.add_playlist_folder("Folder")
+    sub_folder = folder.add_playlist_folder("F1")
+    sub_folder.add_playlist("P1")
+    folder.add_playlist("P1")
+
+    folder.remove_playlist("P1")
+    assert folder.count == 1
+    assert sub_folder.count == 1
 
 
 def test_update_playlist_entries():
@@ -629,3 +670,16 @@ def test_update_playlist_entries():
 
     playlist.remove_track(0)
     assert playlist.entries == 0
+
+
+def test_deprecated_xml_module():
+    # Importing the deprecated module doesn't warn, only using one of its names
+    sys.modules.pop("pyrekordbox.xml", None)
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter("always")
+        module = importlib.import_module("pyrekordbox.xml")
+    assert not record
+
+    with pytest.warns(DeprecationWarning):
+        cls = module.RekordboxXml
+    assert cls is RekordboxXml